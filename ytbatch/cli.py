@@ -2,15 +2,47 @@ from __future__ import annotations
 
 import argparse
 import sys
+import time
 from pathlib import Path
 
-from ytbatch.core import build_run_csv, download_rows, load_rows_from_csv, normalize_query_lines, read_queries_file
+from ytbatch.core import (
+    SearchCache,
+    build_run_csv,
+    download_rows,
+    load_rows_from_csv,
+    normalize_query_lines,
+    read_queries_file,
+)
 from ytbatch.models import DownloadMode
 
 
+# yt-dlp can fire progress hooks hundreds of times per second; each print
+# flushes a write syscall to the TTY. Rate-limit redraws to ~10/s, tracked
+# per row: with --concurrency every worker reports its own row, and a single
+# shared timestamp would let one fast worker starve the others' updates.
+_PROGRESS_INTERVAL = 0.1
+_last_progress: dict[int | None, float] = {}
+
+# Hoisted formatting constants: the hook runs thousands of times per file,
+# so avoid redoing the /1024/1024 divisions and ljust scan on every tick.
+_INV_MB = 1.0 / (1024 * 1024)
+_LINE_WIDTH = 110
+_PAD = " " * _LINE_WIDTH
+_FINISHED_LINE = "\rDownload finished. Post-processing...".ljust(_LINE_WIDTH + 1)
+
+
 def _progress_line(d: dict) -> None:
+    # Under --concurrency, download_rows stamps each tick with its 1-based
+    # row index; those rows print whole labeled lines because \r redraws
+    # from different workers would overwrite one another indistinguishably.
     status = d.get("status")
+    row = d.get("ytbatch_row")
     if status == "downloading":
+        now = time.monotonic()
+        if now - _last_progress.get(row, 0.0) < _PROGRESS_INTERVAL:
+            return
+        _last_progress[row] = now
+
         downloaded = d.get("downloaded_bytes") or 0
         total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
         speed = d.get("speed") or 0
@@ -18,19 +50,25 @@ def _progress_line(d: dict) -> None:
 
         if total:
             pct = downloaded / total * 100.0
-            msg = f"{pct:6.2f}%  {downloaded/1024/1024:7.2f}MB/{total/1024/1024:7.2f}MB"
+            msg = "%6.2f%%  %7.2fMB/%7.2fMB" % (pct, downloaded * _INV_MB, total * _INV_MB)
         else:
-            msg = f"{downloaded/1024/1024:7.2f}MB"
+            msg = "%7.2fMB" % (downloaded * _INV_MB)
 
         if speed:
-            msg += f"  {speed/1024/1024:5.2f}MB/s"
+            msg += "  %5.2fMB/s" % (speed * _INV_MB)
         if eta:
-            msg += f"  ETA {eta:4d}s"
+            msg += "  ETA %4ds" % eta
 
-        print("\r" + msg.ljust(110), end="", flush=True)
+        if row is None:
+            print("\r" + msg + _PAD[len(msg):], end="", flush=True)
+        else:
+            print("[%d] %s" % (row, msg), flush=True)
 
     elif status == "finished":
-        print("\rDownload finished. Post-processing...".ljust(110), flush=True)
+        if row is None:
+            print(_FINISHED_LINE, flush=True)
+        else:
+            print("[%d] Download finished. Post-processing..." % row, flush=True)
 
 
 def main() -> int:
@@ -49,6 +87,25 @@ def main() -> int:
         help="Base directory for per-run folders (CSV). Default: per-user cache.",
     )
     ap.add_argument("--no-download", action="store_true", help="Only build the CSV; do not download.")
+    ap.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of parallel downloads (each worker uses its own yt-dlp instance).",
+    )
+    ap.add_argument(
+        "--search-concurrency",
+        type=int,
+        default=8,
+        help="Number of parallel YouTube searches when building the CSV.",
+    )
+    ap.add_argument("--no-cache", action="store_true", help="Do not use the persistent search-result cache.")
+    ap.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=SearchCache.DEFAULT_TTL_DAYS,
+        help="Days before cached search results expire (0 = never).",
+    )
     ap.add_argument(
         "--skip-existing",
         action="store_true",
@@ -85,7 +142,18 @@ def main() -> int:
                     print("No input provided. Use --queries-file, --query, or --from-csv.", file=sys.stderr)
                     return 2
 
-            run_paths, rows = build_run_csv(queries, base_run_dir=base_run_dir, on_status=status)
+            cache = None if args.no_cache else SearchCache(ttl_days=max(0, args.cache_ttl))
+            try:
+                run_paths, rows = build_run_csv(
+                    queries,
+                    base_run_dir=base_run_dir,
+                    on_status=status,
+                    search_concurrency=max(1, args.search_concurrency),
+                    cache=cache,
+                )
+            finally:
+                if cache:
+                    cache.close()
             status(f"Run folder: {run_paths.run_dir}")
             status(f"CSV saved:   {run_paths.csv_path}")
             status(f"Valid rows:  {len(rows)}")
@@ -103,6 +171,7 @@ def main() -> int:
             progress_cb=_progress_line,
             on_status=status,
             skip_existing=args.skip_existing,
+            concurrency=max(1, args.concurrency),
         )
         status(f"All done. Output: {out_dir}")
         return 0
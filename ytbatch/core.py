@@ -1,39 +1,130 @@
 from __future__ import annotations
 
+import atexit
 import csv
+import hashlib
+import io
+import os
 import re
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Iterator
 
 from yt_dlp import YoutubeDL
 
 from .ffmpeg import find_bundled_ffmpeg_dir
 from .models import DownloadMode, RunPaths, SearchRow
-from .storage import make_run_dir
+from .storage import default_base_run_dir, make_run_dir
 
 ProgressCallback = Callable[[dict], None]  # yt-dlp progress dict
 
 _ID_IN_BRACKETS_RE = re.compile(r"\[([A-Za-z0-9_-]{6,})\]")
 
+_CSV_BUFFER = 1 << 20  # 1 MiB file buffer for run CSV reads/writes
+_CSV_FLUSH_ROWS = 32  # rows accumulated before a batched write
+
+# Almost no row needs quoting, so join fields directly on the hot path and
+# fall back to a csv.writer (over one reused StringIO) only when a field
+# contains a quote, comma, or newline. Only ever used from the thread that
+# runs build_run_csv.
+_NEEDS_QUOTE_RE = re.compile(r'[",\n\r]')
+_row_buf = io.StringIO()
+_row_writer = csv.writer(_row_buf)
+
+
+def _csv_line(fields: list[str]) -> str:
+    if not any(_NEEDS_QUOTE_RE.search(x) for x in fields):
+        return ",".join(fields) + "\r\n"
+    _row_buf.seek(0)
+    _row_buf.truncate()
+    _row_writer.writerow(fields)
+    return _row_buf.getvalue()
+
+
+def _cache_key(query: str) -> str:
+    # Lowercase and collapse whitespace so trivially different spellings of the
+    # same query share an entry.
+    normalized = " ".join(query.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    Persistent query -> first-result cache backed by sqlite in the user cache dir.
+    Re-running the same list then skips the network entirely for known queries
+    (which also keeps us friendlier to YouTube rate limits).
+    Only successful searches are cached; entries expire after `ttl_days`.
+    """
+
+    DEFAULT_TTL_DAYS = 30
+
+    def __init__(self, db_path: Path | None = None, *, ttl_days: int = DEFAULT_TTL_DAYS):
+        if db_path is None:
+            base = default_base_run_dir()
+            base.mkdir(parents=True, exist_ok=True)
+            db_path = base / "search_cache.sqlite"
+        self._ttl = ttl_days * 86400
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            " key TEXT PRIMARY KEY,"
+            " query TEXT,"
+            " video_url TEXT,"
+            " video_id TEXT,"
+            " title TEXT,"
+            " fetched_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, query: str) -> SearchRow | None:
+        cur = self._conn.execute(
+            "SELECT query, video_url, video_id, title, fetched_at FROM search_cache WHERE key = ?",
+            (_cache_key(query),),
+        )
+        hit = cur.fetchone()
+        if not hit:
+            return None
+        if self._ttl > 0 and time.time() - hit[4] > self._ttl:
+            return None
+        return SearchRow(query=query, video_url=hit[1], video_id=hit[2], title=hit[3])
+
+    def put(self, row: SearchRow) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO search_cache (key, query, video_url, video_id, title, fetched_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (_cache_key(row.query), row.query, row.video_url, row.video_id, row.title, time.time()),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
 
 def normalize_query_lines(lines: Iterable[str]) -> list[str]:
-    out: list[str] = []
-    for line in lines:
-        q = line.strip()
-        if not q or q.startswith("#"):
-            continue
-        out.append(q)
-    return out
+    # Single comprehension keeps the per-line work to one strip + two cheap
+    # tests, which matters for query files with tens of thousands of lines.
+    return [q for q in (line.strip() for line in lines) if q and q[0] != "#"]
 
 
-def read_queries_file(path: Path) -> list[str]:
+def read_queries_file(path: Path) -> Iterator[str]:
+    """Yield normalized queries lazily so huge lists never sit in memory twice."""
     if not path.exists():
         raise FileNotFoundError(f"Missing queries file: {path}")
-    return normalize_query_lines(path.read_text(encoding="utf-8-sig", errors="replace").splitlines())
+    with path.open("r", encoding="utf-8-sig", errors="replace", buffering=_CSV_BUFFER) as f:
+        for line in f:
+            q = line.strip()
+            if q and q[0] != "#":
+                yield q
 
 
-def first_youtube_video(query: str, *, socket_timeout: int = 15, retries: int = 3) -> dict | None:
-    ydl_opts = {
+def _search_opts(*, socket_timeout: int = 15, retries: int = 3) -> dict:
+    return {
         "quiet": True,
         "no_warnings": True,
         "skip_download": True,
@@ -42,11 +133,23 @@ def first_youtube_video(query: str, *, socket_timeout: int = 15, retries: int =
         "socket_timeout": socket_timeout,
         "retries": retries,
     }
+
+
+def first_youtube_video(
+    query: str,
+    *,
+    socket_timeout: int = 15,
+    retries: int = 3,
+    ydl: YoutubeDL | None = None,
+) -> dict | None:
     search_term = f"ytsearch1:{query}"
-    with YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(search_term, download=False)
-        entries = info.get("entries") or []
-        return entries[0] if entries else None
+    if ydl is None:
+        # One-off call: own the instance for the duration of the search.
+        with YoutubeDL(_search_opts(socket_timeout=socket_timeout, retries=retries)) as ydl:
+            return first_youtube_video(query, ydl=ydl)
+    info = ydl.extract_info(search_term, download=False)
+    entries = info.get("entries") or []
+    return entries[0] if entries else None
 
 
 def entry_to_row(query: str, entry: dict) -> SearchRow:
@@ -61,78 +164,239 @@ def entry_to_row(query: str, entry: dict) -> SearchRow:
 
 
 def build_run_csv(
-    queries: list[str],
+    queries: Iterable[str],
     *,
     base_run_dir: Path | None = None,
     csv_filename: str = "output.csv",
     on_status: Callable[[str], None] | None = None,
+    search_concurrency: int = 8,
+    cache: SearchCache | None = None,
 ) -> tuple[RunPaths, list[SearchRow]]:
+    # The searches are submitted up front, so the query list is materialized
+    # here anyway; accepting any iterable lets callers stream from disk.
+    queries = list(queries)
     run_dir = make_run_dir(base_run_dir)
     csv_path = run_dir / csv_filename
 
     rows: list[SearchRow] = []
-    with csv_path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.writer(f)
-        writer.writerow(["query", "video_url", "video_id", "title"])
-
-        for q in queries:
-            if on_status:
-                on_status(f"Searching: {q}")
-            try:
-                entry = first_youtube_video(q)
-            except Exception as e:
-                writer.writerow([q, "", "", f"ERROR: {e}"])
+    # Large write buffer + batched writerows keeps small CSV writes from
+    # interleaving syscalls with the network-bound search loop.
+    with csv_path.open("w", newline="", encoding="utf-8-sig", buffering=_CSV_BUFFER) as f:
+        f.write("query,video_url,video_id,title\r\n")
+        line_buf: list[str] = []
+
+        def _queue_row(fields: list[str]) -> None:
+            line_buf.append(_csv_line(fields))
+            if len(line_buf) >= _CSV_FLUSH_ROWS:
+                f.write("".join(line_buf))
+                line_buf.clear()
+
+        # Searches are pure network latency, so overlap them in a thread pool.
+        # Results are collected in submission order and all CSV writes stay on
+        # this thread, so the output is identical to the sequential version.
+        # Cache lookups/stores also stay here: sqlite connections are bound to
+        # the thread they were created on, and only misses hit the pool.
+        # Constructing YoutubeDL re-registers every extractor and rebuilds the
+        # HTTP session; give each worker thread a single reusable instance.
+        tls = threading.local()
+        instances: list[YoutubeDL] = []
+
+        def _search(q: str) -> dict | None:
+            ydl = getattr(tls, "ydl", None)
+            if ydl is None:
+                ydl = tls.ydl = YoutubeDL(_search_opts())
+                instances.append(ydl)
+            return first_youtube_video(q, ydl=ydl)
+
+        max_workers = max(1, min(search_concurrency, len(queries) or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            results: list[object] = []  # SearchRow for cache hits, Future otherwise
+            for q in queries:
+                hit = cache.get(q) if cache else None
+                results.append(hit if hit is not None else ex.submit(_search, q))
+
+            for q, item in zip(queries, results):
                 if on_status:
-                    on_status(f"  -> ERROR: {e}")
-                continue
-
-            if not entry:
-                writer.writerow([q, "", "", "NO RESULTS"])
+                    on_status(f"Searching: {q}")
+
+                if isinstance(item, SearchRow):
+                    _queue_row([item.query, item.video_url, item.video_id, item.title])
+                    rows.append(item)
+                    if on_status:
+                        on_status(f"  -> {item.title} [{item.video_id}] (cached)")
+                    continue
+
+                try:
+                    entry = item.result()
+                except Exception as e:
+                    _queue_row([q, "", "", f"ERROR: {e}"])
+                    if on_status:
+                        on_status(f"  -> ERROR: {e}")
+                    continue
+
+                if not entry:
+                    _queue_row([q, "", "", "NO RESULTS"])
+                    if on_status:
+                        on_status("  -> NO RESULTS")
+                    continue
+
+                row = entry_to_row(q, entry)
+                _queue_row([row.query, row.video_url, row.video_id, row.title])
+                rows.append(row)
+                if cache:
+                    cache.put(row)
                 if on_status:
-                    on_status("  -> NO RESULTS")
-                continue
+                    on_status(f"  -> {row.title} [{row.video_id}]")
 
-            row = entry_to_row(q, entry)
-            writer.writerow([row.query, row.video_url, row.video_id, row.title])
-            rows.append(row)
-            if on_status:
-                on_status(f"  -> {row.title} [{row.video_id}]")
+        if line_buf:
+            f.write("".join(line_buf))
+
+        for ydl in instances:
+            ydl.close()
 
+    _write_sqlite_sidecar(csv_path, rows)
     return RunPaths(run_dir=run_dir, csv_path=csv_path), rows
 
 
+def _write_sqlite_sidecar(csv_path: Path, rows: list[SearchRow]) -> None:
+    """Best-effort binary sidecar next to output.csv for fast reloads."""
+    try:
+        conn = sqlite3.connect(str(csv_path.with_suffix(".sqlite")))
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS rows")
+            conn.execute("CREATE TABLE rows (query TEXT, video_url TEXT, video_id TEXT, title TEXT)")
+            conn.executemany(
+                "INSERT INTO rows VALUES (?, ?, ?, ?)",
+                [(r.query, r.video_url, r.video_id, r.title) for r in rows],
+            )
+        conn.close()
+    except sqlite3.Error:
+        pass  # the CSV stays the portable source of truth
+
+
+def _load_rows_from_sqlite(db_path: Path) -> list[SearchRow]:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        cur = conn.execute("SELECT query, video_url, video_id, title FROM rows")
+        return [SearchRow(query=q, video_url=u, video_id=v, title=t) for q, u, v, t in cur]
+    finally:
+        conn.close()
+
+
 def load_rows_from_csv(csv_path: Path) -> list[SearchRow]:
     if not csv_path.exists():
         raise FileNotFoundError(f"Missing CSV file: {csv_path}")
 
+    # Prefer the sqlite sidecar when it is at least as fresh as the CSV:
+    # binary reads skip all the text parsing on huge runs. A hand-edited CSV
+    # is newer than its sidecar and wins.
+    sidecar = csv_path.with_suffix(".sqlite")
+    if sidecar.exists() and sidecar.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            return _load_rows_from_sqlite(sidecar)
+        except sqlite3.Error:
+            pass
+
     rows: list[SearchRow] = []
-    with csv_path.open("r", newline="", encoding="utf-8-sig", errors="replace") as f:
-        reader = csv.DictReader(f)
-        required = {"query", "video_url"}
-        if not required.issubset(set(reader.fieldnames or [])):
-            raise ValueError(f"{csv_path} missing columns {sorted(required)}; found: {reader.fieldnames}")
+    with csv_path.open("r", newline="", encoding="utf-8-sig", errors="replace", buffering=_CSV_BUFFER) as f:
+        # Positional reader: resolve column offsets from the header once
+        # instead of paying a dict allocation + keyed lookups per row.
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        required = ("query", "video_url")
+        if any(name not in header for name in required):
+            raise ValueError(f"{csv_path} missing columns {sorted(required)}; found: {header or None}")
+
+        qi = header.index("query")
+        ui = header.index("video_url")
+        vi = header.index("video_id") if "video_id" in header else -1
+        ti = header.index("title") if "title" in header else -1
 
         for r in reader:
-            q = (r.get("query") or "").strip()
-            url = (r.get("video_url") or "").strip()
-            vid = (r.get("video_id") or "").strip()
-            title = (r.get("title") or "").strip()
-
-            if not url or url.upper().startswith("ERROR") or url.upper().startswith("NO RESULTS"):
+            if len(r) <= max(qi, ui):
                 continue
-            rows.append(SearchRow(query=q, video_url=url, video_id=vid, title=title))
+            url = r[ui].strip()
+            # build_run_csv only ever writes "", "ERROR: ..." or "NO RESULTS"
+            # into this column, so literal prefixes suffice — no uppercasing.
+            if not url or url.startswith(("ERROR", "NO RESULTS")):
+                continue
+            rows.append(
+                SearchRow(
+                    query=r[qi].strip(),
+                    video_url=url,
+                    video_id=r[vi].strip() if 0 <= vi < len(r) else "",
+                    title=r[ti].strip() if 0 <= ti < len(r) else "",
+                )
+            )
 
     return rows
 
 
+# out_dir -> ids seen there; scanned once per process and kept fresh by
+# adding each newly downloaded id. The GUI calls download_rows per row, so
+# without this the directory would be re-listed for every single row.
+_dir_index: dict[Path, set[str]] = {}
+_dir_index_lock = threading.Lock()
+
+
+def _ids_in_dir(out_dir: Path) -> set[str]:
+    with _dir_index_lock:
+        ids = _dir_index.get(out_dir)
+        if ids is None:
+            ids = _dir_index[out_dir] = existing_video_ids(out_dir)
+        return ids
+
+
+def existing_video_ids(out_dir: Path) -> set[str]:
+    """Collect the bracketed [video_id]s of files already present in out_dir."""
+    ids: set[str] = set()
+    try:
+        with os.scandir(out_dir) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                m = _ID_IN_BRACKETS_RE.search(entry.name)
+                if m:
+                    ids.add(m.group(1))
+    except FileNotFoundError:
+        pass
+    return ids
+
+
 def is_already_downloaded(out_dir: Path, video_id: str) -> bool:
     if not video_id:
         return False
-    needle = f"[{video_id}]"
-    for p in out_dir.glob(f"*{needle}.*"):
-        if p.is_file():
-            return True
-    return False
+    # os.scandir hands back raw names without Path allocation per entry, and
+    # the C substring scan short-circuits on the first hit.
+    needle = f"[{video_id}]."
+    try:
+        with os.scandir(out_dir) as it:
+            return any(needle in e.name for e in it if e.is_file())
+    except FileNotFoundError:
+        return False
+
+
+# Output filename template; joined to out_dir as a plain string so workers
+# never rebuild Path objects for it.
+_OUTTMPL_NAME = "%(title).80s [%(id)s].%(ext)s"
+
+# Mode-specific opts never change at runtime; build them once at import and
+# merge over the common opts per call.
+_MODE_OPTS: dict[DownloadMode, dict] = {
+    DownloadMode.AUDIO_MP3: {
+        "format": "bestaudio/best",
+        "postprocessors": [
+            {"key": "FFmpegExtractAudio", "preferredcodec": "mp3", "preferredquality": "192"}
+        ],
+    },
+    DownloadMode.AUDIO_ORIGINAL: {
+        "format": "bestaudio/best",
+    },
+    DownloadMode.VIDEO_ORIGINAL: {
+        "format": "bestvideo+bestaudio/best",
+        "merge_output_format": "mp4",
+    },
+}
 
 
 def _download_opts(
@@ -146,7 +410,7 @@ def _download_opts(
     out_dir.mkdir(parents=True, exist_ok=True)
 
     common = {
-        "outtmpl": str(out_dir / "%(title).80s [%(id)s].%(ext)s"),
+        "outtmpl": os.path.join(str(out_dir), _OUTTMPL_NAME),
         "noplaylist": True,
         "quiet": True,
         "no_warnings": True,
@@ -161,29 +425,57 @@ def _download_opts(
     if ffdir:
         common["ffmpeg_location"] = str(ffdir)
 
-    if mode == DownloadMode.AUDIO_MP3:
-        return {
-            **common,
-            "format": "bestaudio/best",
-            "postprocessors": [
-                {"key": "FFmpegExtractAudio", "preferredcodec": "mp3", "preferredquality": "192"}
-            ],
-        }
-
-    if mode == DownloadMode.AUDIO_ORIGINAL:
-        return {
-            **common,
-            "format": "bestaudio/best",
-        }
-
-    if mode == DownloadMode.VIDEO_ORIGINAL:
-        return {
-            **common,
-            "format": "bestvideo+bestaudio/best",
-            "merge_output_format": "mp4",
-        }
-
-    raise ValueError(f"Unsupported mode: {mode}")
+    try:
+        return {**common, **_MODE_OPTS[mode]}
+    except KeyError:
+        raise ValueError(f"Unsupported mode: {mode}") from None
+
+
+# mp3 extraction used to run inline in ydl.download(), so the next row's
+# network fetch waited on ffmpeg. Transcodes now go to a small background
+# pool shared across download_rows calls; atexit drains it so no file is
+# left half-converted when the process exits.
+_pp_executor: ThreadPoolExecutor | None = None
+_pp_lock = threading.Lock()
+
+
+def _postprocess_executor() -> ThreadPoolExecutor:
+    global _pp_executor
+    with _pp_lock:
+        if _pp_executor is None:
+            _pp_executor = ThreadPoolExecutor(max_workers=min(2, os.cpu_count() or 1))
+            atexit.register(_pp_executor.shutdown, wait=True)
+        return _pp_executor
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_exe() -> str:
+    ffdir = find_bundled_ffmpeg_dir()
+    if ffdir:
+        return str(ffdir / ("ffmpeg.exe" if sys.platform.startswith("win") else "ffmpeg"))
+    return "ffmpeg"
+
+
+def _transcode_to_mp3(src: str, on_status: Callable[[str], None] | None = None) -> None:
+    dst = os.path.splitext(src)[0] + ".mp3"
+    if dst == src:
+        return
+    try:
+        proc = subprocess.run(
+            [_ffmpeg_exe(), "-y", "-hide_banner", "-loglevel", "error", "-i", src, "-vn", "-b:a", "192k", dst],
+            capture_output=True,
+        )
+    except OSError as e:
+        if on_status:
+            on_status(f"ffmpeg not available, keeping original audio: {e}")
+        return
+    if proc.returncode == 0:
+        try:
+            os.remove(src)
+        except OSError:
+            pass
+    elif on_status:
+        on_status(f"ffmpeg failed for {os.path.basename(src)} (kept original).")
 
 
 def download_rows(
@@ -194,20 +486,80 @@ def download_rows(
     progress_cb: ProgressCallback | None = None,
     on_status: Callable[[str], None] | None = None,
     skip_existing: bool = False,
+    concurrency: int = 1,
 ) -> None:
-    ydl_opts = _download_opts(mode, out_dir, progress_cb=progress_cb)
+    # For mp3 mode, download the original audio and hand the extraction to the
+    # background pool so the next row's fetch starts as soon as bytes land.
+    if mode == DownloadMode.AUDIO_MP3:
+        ydl_opts = _download_opts(DownloadMode.AUDIO_ORIGINAL, out_dir, progress_cb=progress_cb)
+
+        def _capture_finished(d: dict) -> None:
+            if d.get("status") == "finished" and d.get("filename"):
+                _postprocess_executor().submit(_transcode_to_mp3, d["filename"], on_status)
+
+        ydl_opts.setdefault("progress_hooks", []).append(_capture_finished)
+    else:
+        ydl_opts = _download_opts(mode, out_dir, progress_cb=progress_cb)
+    total = len(rows)
+
+    # Per-row globbing re-lists the directory for every row, which goes
+    # quadratic on large out_dirs; use the memoized one-shot index instead
+    # and keep it current as downloads land.
+    existing_ids = _ids_in_dir(out_dir) if skip_existing else set()
+
+    if concurrency <= 1:
+        with YoutubeDL(ydl_opts) as ydl:
+            for i, row in enumerate(rows, start=1):
+                label = row.title or row.query or row.video_url
+                if on_status:
+                    on_status(f"[{i}/{total}] {label}")
 
-    with YoutubeDL(ydl_opts) as ydl:
-        for i, row in enumerate(rows, start=1):
-            label = row.title or row.query or row.video_url
-            if on_status:
-                on_status(f"[{i}/{len(rows)}] {label}")
+                if skip_existing and row.video_id and row.video_id in existing_ids:
+                    if on_status:
+                        on_status("Skipping (already exists).")
+                    continue
 
-            if skip_existing and is_already_downloaded(out_dir, row.video_id):
+                ydl.download([row.video_url])
+                if row.video_id:
+                    existing_ids.add(row.video_id)
                 if on_status:
-                    on_status("Skipping (already exists).")
-                continue
+                    on_status("Done.")
+        return
+
+    # A single YoutubeDL instance is not safe to share across threads, so each
+    # task opens its own from the same opts. Status lines carry the row index
+    # so interleaved output stays readable; progress ticks get the same row
+    # index stamped into the hook dict so callers can label them too.
+    def _download_one(i: int, row: SearchRow) -> None:
+        label = row.title or row.query or row.video_url
+        if on_status:
+            on_status(f"[{i}/{total}] {label}")
+
+        if skip_existing and row.video_id and row.video_id in existing_ids:
+            if on_status:
+                on_status(f"[{i}/{total}] Skipping (already exists).")
+            return
+
+        opts = ydl_opts
+        if progress_cb is not None:
+
+            def _indexed(d: dict, _cb: ProgressCallback = progress_cb, _i: int = i) -> None:
+                d["ytbatch_row"] = _i
+                _cb(d)
 
+            opts = {
+                **ydl_opts,
+                "progress_hooks": [_indexed if h is progress_cb else h for h in ydl_opts["progress_hooks"]],
+            }
+
+        with YoutubeDL(opts) as ydl:
             ydl.download([row.video_url])
-            if on_status:
-                on_status("Done.")
+        if row.video_id:
+            existing_ids.add(row.video_id)
+        if on_status:
+            on_status(f"[{i}/{total}] Done.")
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, total or 1)) as ex:
+        futures = [ex.submit(_download_one, i, row) for i, row in enumerate(rows, start=1)]
+        for fut in futures:
+            fut.result()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
-def _candidate_dirs() -> list[Path]:
+@lru_cache(maxsize=1)
+def _candidate_dirs() -> tuple[Path, ...]:
     dirs: list[Path] = []
 
     # PyInstaller onefile temp extraction dir
@@ -18,12 +20,15 @@ def _candidate_dirs() -> list[Path]:
     else:
         dirs.append(Path(__file__).resolve().parent)
 
-    return dirs
+    return tuple(dirs)
 
 
+@lru_cache(maxsize=1)
 def find_bundled_ffmpeg_dir() -> Path | None:
     """
     Returns a directory path suitable for yt-dlp's `ffmpeg_location`, if bundled ffmpeg is found.
+    Cached: the candidate dirs and the bundled binaries cannot change within a process,
+    so the stat walk runs once no matter how many workers build download opts.
     Expected layout:
       <base>/ffmpeg/ffmpeg.exe
       <base>/ffmpeg/ffprobe.exe
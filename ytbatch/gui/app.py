@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import csv
-import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, QSettings, QEvent
-from PySide6.QtGui import QIcon, QGuiApplication, QPalette, QColor
+from PySide6.QtCore import Qt, QSettings, QEvent, QAbstractTableModel, QModelIndex, QTimer, QUrl
+from PySide6.QtGui import QIcon, QGuiApplication, QPalette, QColor, QDesktopServices
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -19,8 +19,9 @@ from PySide6.QtWidgets import (
     QPushButton,
     QPlainTextEdit,
     QComboBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QHeaderView,
+    QSpinBox,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QCheckBox,
@@ -31,9 +32,11 @@ from PySide6.QtWidgets import (
 
 from ytbatch.models import DownloadMode
 from ytbatch.storage import default_base_run_dir
-from ytbatch.gui.worker import JobConfig, ThreadRunner
 from ytbatch.resources import resource_path
 
+if TYPE_CHECKING:
+    from ytbatch.gui.worker import JobConfig, ThreadRunner
+
 
 def open_folder(path: str) -> None:
     p = Path(path)
@@ -41,13 +44,53 @@ def open_folder(path: str) -> None:
         p = p.parent
     if not p.exists():
         return
-    if sys.platform.startswith("win"):
-        os.startfile(str(p))  # type: ignore[attr-defined]
-    elif sys.platform == "darwin":
-        os.system(f'open "{p}"')
-    else:
-        os.system(f'xdg-open "{p}"')
-
+    # Qt-native, non-blocking, and immune to shell-quoting issues in paths.
+    QDesktopServices.openUrl(QUrl.fromLocalFile(str(p)))
+
+
+def _parse_run_csv(csv_path: str) -> tuple[list[str], dict[str, tuple[str, str]], list[tuple[str, str]]]:
+    """
+    One streaming pass over a run CSV: returns the ordered query list, a
+    query -> (title, url) lookup (first occurrence wins), and all (title, url)
+    pairs in file order for the sequential-fill fallback. Delimiter is sniffed
+    from the header line; columns are resolved positionally once so no dict is
+    allocated per row.
+    """
+    queries: list[str] = []
+    lookup: dict[str, tuple[str, str]] = {}
+    pairs: list[tuple[str, str]] = []
+
+    with open(csv_path, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
+        first = f.readline()
+        delimiter = ";" if first.count(";") > first.count(",") else ","
+        f.seek(0)
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None) or []
+
+        def _col(*names: str) -> int:
+            return next((header.index(n) for n in names if n in header), -1)
+
+        qi = _col("query", "search")
+        ti = _col("title", "video_title")
+        ui = _col("video_url", "url", "video")
+
+        for row in reader:
+            n = len(row)
+            q = row[qi].strip() if 0 <= qi < n else ""
+            title = row[ti].strip() if 0 <= ti < n else ""
+            url = row[ui].strip() if 0 <= ui < n else ""
+            pairs.append((title, url))
+            if q:
+                queries.append(q)
+                if q not in lookup:
+                    lookup[q] = (title, url)
+
+    return queries, lookup, pairs
+
+
+# dragEnterEvent fires continuously while hovering; keep its per-event work
+# to a string slice and a frozenset lookup.
+_ACCEPTED_DROP_SUFFIXES = frozenset({".txt", ".csv"})
 
 THEME_SYSTEM = "system"
 THEME_LIGHT = "light"
@@ -64,7 +107,14 @@ def system_prefers_dark() -> bool:
         return c.lightness() < 128
 
 
+# Built once on first use; the dark palette never changes within a process.
+_dark_palette: QPalette | None = None
+
+
 def make_dark_palette() -> QPalette:
+    global _dark_palette
+    if _dark_palette is not None:
+        return _dark_palette
     pal = QPalette()
     pal.setColor(QPalette.Window, QColor(30, 30, 30))
     pal.setColor(QPalette.WindowText, QColor(220, 220, 220))
@@ -78,20 +128,34 @@ def make_dark_palette() -> QPalette:
     pal.setColor(QPalette.BrightText, QColor(255, 0, 0))
     pal.setColor(QPalette.Highlight, QColor(80, 140, 255))
     pal.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
+    _dark_palette = pal
+    return pal
+
+
+def _standard_palette(app: QApplication) -> QPalette:
+    pal = app.property("ytbatch_standard_palette")
+    if pal is None:
+        pal = app.style().standardPalette()
+        app.setProperty("ytbatch_standard_palette", pal)
     return pal
 
 
 def apply_theme(app: QApplication, theme: str) -> None:
     theme = (theme or THEME_SYSTEM).lower()
+    # setPalette re-polishes every top-level widget; skip the whole walk when
+    # the requested theme is the one already applied.
+    if app.property("ytbatch_theme") == theme:
+        return
+    app.setProperty("ytbatch_theme", theme)
     if theme == THEME_LIGHT:
-        app.setPalette(app.style().standardPalette())
+        app.setPalette(_standard_palette(app))
     elif theme == THEME_DARK:
         app.setPalette(make_dark_palette())
     else:
         if system_prefers_dark():
             app.setPalette(make_dark_palette())
         else:
-            app.setPalette(app.style().standardPalette())
+            app.setPalette(_standard_palette(app))
 
 
 class SettingsDialog(QDialog):
@@ -131,11 +195,78 @@ class SettingsDialog(QDialog):
         return str(self.theme_combo.currentData())
 
 
+class RowsModel(QAbstractTableModel):
+    """
+    Backs the results table with a plain list of row lists. Unlike the old
+    QTableWidget, nothing is allocated per cell and Qt only asks for the rows
+    it actually paints, which keeps large runs responsive.
+    """
+
+    HEADERS = ("#", "Query", "Title", "URL", "Progress")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[list[str]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Early-return for every non-display role; the view probes many roles
+        # per visible cell.
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        return self.HEADERS[section] if orientation == Qt.Horizontal else str(section + 1)
+
+    def reset_rows(self, queries: list[str]) -> None:
+        self.beginResetModel()
+        self._rows = [[str(i), q, "", "", "0%"] for i, q in enumerate(queries, start=1)]
+        self.endResetModel()
+
+    def query_at(self, row: int) -> str:
+        return self._rows[row][1] if 0 <= row < len(self._rows) else ""
+
+    def queries(self) -> list[str]:
+        """Snapshot of the query column, cheaper than per-row accessor calls."""
+        return [r[1] for r in self._rows]
+
+    def set_cell(self, row: int, col: int, value: str) -> None:
+        if 0 <= row < len(self._rows):
+            self._rows[row][col] = value
+            ix = self.index(row, col)
+            self.dataChanged.emit(ix, ix, [Qt.DisplayRole])
+
+    def set_titles_urls(self, updates: dict[int, tuple[str, str]]) -> None:
+        """Apply many (title, url) pairs with a single dataChanged emission."""
+        applied: list[int] = []
+        for row, (title, url) in updates.items():
+            if 0 <= row < len(self._rows):
+                r = self._rows[row]
+                if title:
+                    r[2] = title
+                if url:
+                    r[3] = url
+                applied.append(row)
+        if applied:
+            self.dataChanged.emit(
+                self.index(min(applied), 2), self.index(max(applied), 3), [Qt.DisplayRole]
+            )
+
+
 class DropOverlay(QFrame):
     def __init__(self, parent: QWidget):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         self.hide()
+        self._last_parent_size = None
 
         self.setStyleSheet(
             """
@@ -171,6 +302,12 @@ class DropOverlay(QFrame):
         parent = self.parentWidget()
         if not parent:
             return
+        # Geometry only depends on the parent size; skip the setGeometry call
+        # on drag-enters that arrive without an intervening resize.
+        size = parent.size()
+        if size == self._last_parent_size:
+            return
+        self._last_parent_size = size
         margin = 14
         self.setGeometry(
             margin,
@@ -205,8 +342,18 @@ class MainWindow(QMainWindow):
         self.skip_existing_chk = QCheckBox("Skip existing")
         self.skip_existing_chk.setChecked(bool(self.settings.value("skip_existing", True)))
 
-        self.out_dir_edit = QLineEdit(self.settings.value("out_dir", str(Path("downloads").resolve())))
-        self.run_dir_edit = QLineEdit(self.settings.value("run_dir", str(default_base_run_dir().resolve())))
+        self.parallel_spin = QSpinBox()
+        self.parallel_spin.setRange(1, 8)
+        self.parallel_spin.setValue(int(self.settings.value("parallelism", 3)))
+        self.parallel_spin.setToolTip("Number of downloads running at once.")
+
+        # No resolve() here: realpath/symlink walks block the UI thread before
+        # first paint, and _cfg() resolves when the paths are actually used.
+        # default_base_run_dir is only consulted when no setting is stored.
+        out_dir = self.settings.value("out_dir") or "downloads"
+        run_dir = self.settings.value("run_dir") or str(default_base_run_dir())
+        self.out_dir_edit = QLineEdit(out_dir)
+        self.run_dir_edit = QLineEdit(run_dir)
 
         self.btn_browse_out = QPushButton("Browse…")
         self.btn_browse_run = QPushButton("Browse…")
@@ -223,9 +370,15 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Status: idle")
         self.status_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["#", "Query", "Title", "URL", "Progress"])
+        self.model = RowsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
+        # Fixed uniform row heights: the view never has to measure cell
+        # contents when thousands of rows come in at once.
+        vh = self.table.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(20)
 
         # Layout
         central = QWidget()
@@ -235,6 +388,8 @@ class MainWindow(QMainWindow):
         top.addWidget(QLabel("Mode"), 0, 0)
         top.addWidget(self.mode_combo, 0, 1)
         top.addWidget(self.skip_existing_chk, 0, 2)
+        top.addWidget(QLabel("Parallel"), 0, 3)
+        top.addWidget(self.parallel_spin, 0, 4)
 
         top.addWidget(QLabel("Output folder"), 1, 0)
         top.addWidget(self.out_dir_edit, 1, 1)
@@ -289,9 +444,12 @@ class MainWindow(QMainWindow):
         #act = menu.addAction("Preferences…")
         #act.triggered.connect(self._open_settings)
 
-    def _has_queries(self) -> bool:
-        return len(self._collect_queries()) > 0
-    
+        # Progress is polled from the worker at ~10 Hz rather than delivered
+        # per yt-dlp tick; see Worker.take_progress.
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush_progress)
+        self._flush_timer.start(100)
+
     def eventFilter(self, obj, event):
         if obj is self and event.type() == QEvent.Resize:
             if hasattr(self, "drop_overlay"):
@@ -303,7 +461,7 @@ class MainWindow(QMainWindow):
         self.settings.setValue("out_dir", self.out_dir_edit.text().strip())
         self.settings.setValue("run_dir", self.run_dir_edit.text().strip())
         self.settings.setValue("skip_existing", self.skip_existing_chk.isChecked())
-        self.settings.setValue("theme", self.settings.value("theme", THEME_SYSTEM))
+        self.settings.setValue("parallelism", self.parallel_spin.value())
         super().closeEvent(event)
 
     def _open_settings(self) -> None:
@@ -342,105 +500,70 @@ class MainWindow(QMainWindow):
         self.status_label.setText(f"Status: {msg}")
 
     def _reset_table(self, lines: list[str]) -> None:
-        self.table.setRowCount(0)
-        for i, q in enumerate(lines, start=1):
-            r = self.table.rowCount()
-            self.table.insertRow(r)
-            self.table.setItem(r, 0, QTableWidgetItem(str(i)))
-            self.table.setItem(r, 1, QTableWidgetItem(q))
-            self.table.setItem(r, 2, QTableWidgetItem(""))
-            self.table.setItem(r, 3, QTableWidgetItem(""))
-            self.table.setItem(r, 4, QTableWidgetItem("0%"))
+        self.model.reset_rows(lines)
+
+    @staticmethod
+    def _queries_from_text(text: str) -> list[str]:
+        return [q for q in (ln.strip() for ln in text.splitlines()) if q and not q.startswith("#")]
 
     def _collect_queries(self) -> list[str]:
-        raw = self.queries_edit.toPlainText().splitlines()
-        return [ln.strip() for ln in raw if ln.strip() and not ln.strip().startswith("#")]
+        return self._queries_from_text(self.queries_edit.toPlainText())
+
+    def _cfg(self, text: str | None = None, queries: list[str] | None = None) -> JobConfig:
+        from ytbatch.gui.worker import JobConfig
 
-    def _cfg(self) -> JobConfig:
         mode = DownloadMode(self.mode_combo.currentText())
         out_dir = Path(self.out_dir_edit.text().strip()).expanduser().resolve()
         base_run_dir = Path(self.run_dir_edit.text().strip()).expanduser().resolve()
-        text = self.queries_edit.toPlainText()
+        if text is None:
+            text = self.queries_edit.toPlainText()
         return JobConfig(
             mode=mode,
             out_dir=out_dir,
             base_run_dir=base_run_dir,
             queries_text=text,
+            queries=queries,
             skip_existing=self.skip_existing_chk.isChecked(),
+            parallelism=self.parallel_spin.value(),
         )
 
-    def _populate_from_csv(self, csv_path: str) -> None:
-        try:
-            raw = Path(csv_path).read_text(encoding="utf-8-sig", errors="replace")
-        except Exception as e:
-            self._status(f"Could not read CSV: {e}")
-            return
-
-        # Detect delimiter (common: comma or semicolon)
-        first_line = raw.splitlines()[0] if raw.splitlines() else ""
-        delimiter = ";" if first_line.count(";") > first_line.count(",") else ","
-
-        try:
-            with open(csv_path, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
-                reader = csv.DictReader(f, delimiter=delimiter)
-                rows = list(reader)
-        except Exception as e:
-            self._status(f"Could not parse CSV: {e}")
-            return
-
-        # Debug-ish status
-        headers = list(reader.fieldnames or []) if "reader" in locals() else []
-        self._status(f"Loaded CSV ({len(rows)} rows), delimiter='{delimiter}', headers={headers}")
-
-        # Accept either video_url or url
-        def get_url(r: dict) -> str:
-            return (r.get("video_url") or r.get("url") or r.get("video") or "").strip()
-
-        def get_title(r: dict) -> str:
-            return (r.get("title") or r.get("video_title") or "").strip()
+    def _populate_from_csv(
+        self,
+        csv_path: str,
+        parsed: tuple[list[str], dict[str, tuple[str, str]], list[tuple[str, str]]] | None = None,
+    ) -> None:
+        if parsed is None:
+            try:
+                parsed = _parse_run_csv(csv_path)
+            except Exception as e:
+                self._status(f"Could not parse CSV: {e}")
+                return
+        _queries, lookup, pairs = parsed
 
-        def get_query(r: dict) -> str:
-            return (r.get("query") or r.get("search") or "").strip()
+        self._status(f"Loaded CSV ({len(pairs)} rows)")
 
-        lookup: dict[str, tuple[str, str]] = {}
-        for r in rows:
-            q = get_query(r)
+        # Collect everything first, then let the model announce one change
+        # spanning the title/URL columns instead of one signal per cell.
+        updates: dict[int, tuple[str, str]] = {}
+        for i, q in enumerate(self.model.queries()):
+            q = q.strip()
             if not q:
                 continue
-            if q not in lookup:
-                lookup[q] = (get_title(r), get_url(r))
-
-        filled = 0
-        for i in range(self.table.rowCount()):
-            q_item = self.table.item(i, 1)
-            if not q_item:
-                continue
-            q = q_item.text().strip()
             title, url = lookup.get(q, ("", ""))
-            if title:
-                self.table.setItem(i, 2, QTableWidgetItem(title))
-            if url:
-                self.table.setItem(i, 3, QTableWidgetItem(url))
             if title or url:
-                filled += 1
+                updates[i] = (title, url)
 
-        if filled == 0 and rows:
+        if not updates and pairs:
             # If nothing matched by query, try sequential fill as a fallback (same order)
-            n = min(self.table.rowCount(), len(rows))
-            for i in range(n):
-                r = rows[i]
-                title, url = get_title(r), get_url(r)
-                if title:
-                    self.table.setItem(i, 2, QTableWidgetItem(title))
-                if url:
-                    self.table.setItem(i, 3, QTableWidgetItem(url))
+            n = min(self.model.rowCount(), len(pairs))
+            updates = {i: pairs[i] for i in range(n) if pairs[i][0] or pairs[i][1]}
             self._status("CSV loaded but queries didn't match; filled sequentially as fallback.")
 
+        self.model.set_titles_urls(updates)
+
 
     def _wire_runner(self, runner: ThreadRunner) -> None:
-        runner.worker.status.connect(self._status)
         runner.worker.csv_built.connect(self._on_csv_built)
-        runner.worker.progress.connect(self._on_progress)
         runner.worker.finished.connect(self._on_finished)
         runner.worker.failed.connect(self._on_failed)
 
@@ -467,13 +590,17 @@ class MainWindow(QMainWindow):
         self.btn_load_list.setEnabled(not running)
 
     def _build_csv_only(self) -> None:
-        queries = self._collect_queries()
+        from ytbatch.gui.worker import ThreadRunner
+
+        # One toPlainText + one split serves the table reset and the config.
+        text = self.queries_edit.toPlainText()
+        queries = self._queries_from_text(text)
         if not queries:
             QMessageBox.information(self, "ytbatch", "No queries provided.")
             return
         self._reset_table(queries)
 
-        cfg = self._cfg()
+        cfg = self._cfg(text, queries)
         self.runner = ThreadRunner(cfg)
         self._wire_runner(self.runner)
         self._set_running(True)
@@ -487,14 +614,16 @@ class MainWindow(QMainWindow):
         self.runner.thread.start()
 
     def _start(self) -> None:
-        # If user pasted queries, we run the normal pipeline (build CSV -> download)
-        if self._has_queries():
-            queries = self._collect_queries()
+        from ytbatch.gui.worker import ThreadRunner
 
+        # If user pasted queries, we run the normal pipeline (build CSV -> download)
+        text = self.queries_edit.toPlainText()
+        queries = self._queries_from_text(text)
+        if queries:
             Path(self.out_dir_edit.text().strip()).mkdir(parents=True, exist_ok=True)
             self._reset_table(queries)
 
-            self.runner = ThreadRunner(self._cfg())
+            self.runner = ThreadRunner(self._cfg(text, queries))
             self._wire_runner(self.runner)
             self._set_running(True)
             self.runner.thread.start()
@@ -525,11 +654,20 @@ class MainWindow(QMainWindow):
             self.runner.worker.cancel()
             self._status("Cancelling… (will stop after current item)")
 
-    def _on_progress(self, idx: int, pct: float, text: str) -> None:
-        if 0 <= idx < self.table.rowCount():
-            self.table.setItem(idx, 4, QTableWidgetItem(f"{pct:0.1f}%  {text}"))
+    def _flush_progress(self) -> None:
+        runner = self.runner
+        if not runner:
+            return
+        set_cell = self.model.set_cell
+        for idx, (pct, text) in runner.worker.take_progress().items():
+            set_cell(idx, 4, f"{pct:0.1f}%  {text}")
+
+        msg = runner.worker.take_status()
+        if msg:
+            self._status(msg)
 
     def _on_finished(self) -> None:
+        self._flush_progress()  # apply any snapshots still pending
         self._set_running(False)
         self._status("Finished.")
         self.runner = None
@@ -543,8 +681,9 @@ class MainWindow(QMainWindow):
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             for u in event.mimeData().urls():
-                p = Path(u.toLocalFile())
-                if p.suffix.lower() in (".txt", ".csv"):
+                s = u.toLocalFile()
+                dot = s.rfind(".")
+                if dot >= 0 and s[dot:].lower() in _ACCEPTED_DROP_SUFFIXES:
                     event.acceptProposedAction()
                     self.drop_overlay.resize_to_parent()
                     self.drop_overlay.raise_()
@@ -581,21 +720,17 @@ class MainWindow(QMainWindow):
             self.csv_label.setText(f"CSV: {path}")
             self.btn_open_run.setEnabled(True)
 
-            # Build the table rows from the CSV queries first
+            # Parse once; the same pass feeds both the table reset and the fill.
             try:
-                raw = path.read_text(encoding="utf-8-sig", errors="replace")
-                first_line = raw.splitlines()[0] if raw.splitlines() else ""
-                delimiter = ";" if first_line.count(";") > first_line.count(",") else ","
-                with path.open("r", encoding="utf-8-sig", errors="replace", newline="") as f:
-                    reader = csv.DictReader(f, delimiter=delimiter)
-                    queries = [(r.get("query") or "").strip() for r in reader if (r.get("query") or "").strip()]
-            except Exception:
-                queries = []
-
-            if queries:
-                self._reset_table(queries)
-
-            self._populate_from_csv(str(path))
+                parsed = _parse_run_csv(str(path))
+            except Exception as e:
+                self._status(f"Could not parse CSV: {e}")
+                return
+
+            if parsed[0]:
+                self._reset_table(parsed[0])
+
+            self._populate_from_csv(str(path), parsed=parsed)
             self._status(f"Dropped CSV: {path}")
             return
 
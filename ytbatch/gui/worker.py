@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtCore import QObject, QThread, Signal
 
-from ytbatch.core import build_run_csv, download_rows, load_rows_from_csv, normalize_query_lines, read_queries_file
 from ytbatch.models import DownloadMode, SearchRow
 
+# ytbatch.core (and with it yt-dlp's whole extractor graph) is imported
+# lazily inside Worker.run so the window paints before it loads.
+
 
 @dataclass
 class JobConfig:
@@ -17,13 +22,13 @@ class JobConfig:
     base_run_dir: Optional[Path] = None
     queries_file: Optional[Path] = None
     queries_text: Optional[str] = None
+    queries: Optional[list[str]] = None  # pre-normalized; preferred over queries_text
     from_csv: Optional[Path] = None
     skip_existing: bool = False
+    parallelism: int = 3  # concurrent downloads; network-bound, so threads overlap well
 
 
 class Worker(QObject):
-    status = Signal(str)
-    progress = Signal(int, float, str)  # index (0-based), percent, text
     finished = Signal()
     failed = Signal(str)
     csv_built = Signal(str)  # path
@@ -33,44 +38,81 @@ class Worker(QObject):
         self.cfg = cfg
         self._cancel = False
         self._rows: list[SearchRow] = []
+        # Latest (pct, text) per row; yt-dlp hooks fire many times per second
+        # and a queued signal per tick floods the GUI thread, so the window
+        # polls this at ~10 Hz instead (latest-wins).
+        self._progress_latest: dict[int, tuple[float, str]] = {}
+        self._progress_lock = threading.Lock()
+        # Status text follows the same pattern, latest-wins: one queued signal
+        # per yt-dlp line would flood the GUI thread under parallel downloads.
+        # Plain attribute stores are atomic in CPython, so no lock is needed.
+        self._status_latest = ""
 
     def cancel(self) -> None:
         self._cancel = True
 
-    def _progress_hook_factory(self, row_index: int):
-        def hook(d: dict) -> None:
-            if self._cancel:
-                return
-            status = d.get("status")
-            if status == "downloading":
-                downloaded = d.get("downloaded_bytes") or 0
-                total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
-                pct = (downloaded / total * 100.0) if total else 0.0
-                speed = d.get("speed") or 0
-                eta = d.get("eta") or 0
-                text = f"{pct:5.1f}%"
-                if speed:
-                    text += f"  {speed/1024/1024:0.2f}MB/s"
-                if eta:
-                    text += f"  ETA {eta}s"
-                self.progress.emit(row_index, float(pct), text)
-            elif status == "finished":
-                self.progress.emit(row_index, 100.0, "Post-processing...")
-        return hook
+    def _set_status(self, msg: str) -> None:
+        self._status_latest = msg
+
+    def take_status(self) -> str:
+        snap, self._status_latest = self._status_latest, ""
+        return snap
+
+    def take_progress(self) -> dict[int, tuple[float, str]]:
+        """Atomically swap out the pending per-row progress snapshots."""
+        with self._progress_lock:
+            snap, self._progress_latest = self._progress_latest, {}
+        return snap
+
+    _INV_MB = 1.0 / (1024 * 1024)
+
+    def _hook(self, row_index: int, d: dict) -> None:
+        # Real method bound via functools.partial per row: no closure cells to
+        # dereference on a callback that fires many times per second.
+        if self._cancel:
+            return
+        status = d.get("status")
+        if status == "downloading":
+            downloaded = d.get("downloaded_bytes") or 0
+            total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
+            pct = (downloaded / total * 100.0) if total else 0.0
+            speed = d.get("speed") or 0
+            eta = d.get("eta") or 0
+            text = f"{pct:5.1f}%"
+            if speed:
+                text += f"  {speed * self._INV_MB:0.2f}MB/s"
+            if eta:
+                text += f"  ETA {eta}s"
+            with self._progress_lock:
+                self._progress_latest[row_index] = (pct, text)
+        elif status == "finished":
+            with self._progress_lock:
+                self._progress_latest[row_index] = (100.0, "Post-processing...")
 
     def run(self) -> None:
         try:
+            from ytbatch.core import (
+                build_run_csv,
+                download_rows,
+                load_rows_from_csv,
+                normalize_query_lines,
+                read_queries_file,
+            )
+
             if self.cfg.from_csv:
-                self.status.emit(f"Loading CSV: {self.cfg.from_csv}")
+                self._set_status(f"Loading CSV: {self.cfg.from_csv}")
                 self._rows = load_rows_from_csv(self.cfg.from_csv)
                 if not self._rows:
                     self.failed.emit("No downloadable rows found in CSV.")
                     return
             else:
                 queries: list[str] = []
-                if self.cfg.queries_file:
-                    self.status.emit(f"Reading queries file: {self.cfg.queries_file}")
-                    queries = read_queries_file(self.cfg.queries_file)
+                if self.cfg.queries is not None:
+                    # Already normalized by the window; skip the re-split.
+                    queries = self.cfg.queries
+                elif self.cfg.queries_file:
+                    self._set_status(f"Reading queries file: {self.cfg.queries_file}")
+                    queries = list(read_queries_file(self.cfg.queries_file))
                 elif self.cfg.queries_text is not None:
                     queries = normalize_query_lines(self.cfg.queries_text.splitlines())
 
@@ -81,32 +123,50 @@ class Worker(QObject):
                 run_paths, self._rows = build_run_csv(
                     queries,
                     base_run_dir=self.cfg.base_run_dir,
-                    on_status=lambda s: self.status.emit(s),
+                    on_status=self._set_status,
                 )
                 self.csv_built.emit(str(run_paths.csv_path))
-                self.status.emit(f"Run folder: {run_paths.run_dir}")
-                self.status.emit(f"CSV: {run_paths.csv_path}")
-                self.status.emit(f"Valid rows: {len(self._rows)}")
+                self._set_status(f"Run folder: {run_paths.run_dir}")
+                self._set_status(f"CSV: {run_paths.csv_path}")
+                self._set_status(f"Valid rows: {len(self._rows)}")
                 if not self._rows:
                     self.finished.emit()
                     return
 
-            for idx, row in enumerate(self._rows):
+            total = len(self._rows)
+
+            def _download_one(idx: int, row: SearchRow) -> None:
                 if self._cancel:
-                    self.status.emit("Cancelled.")
-                    break
+                    return
                 label = row.title or row.query or row.video_url
-                self.status.emit(f"[{idx+1}/{len(self._rows)}] {label}")
+                self._set_status(f"[{idx+1}/{total}] {label}")
 
                 download_rows(
                     [row],
                     mode=self.cfg.mode,
                     out_dir=self.cfg.out_dir,
-                    progress_cb=self._progress_hook_factory(idx),
-                    on_status=lambda s: self.status.emit(s),
+                    progress_cb=functools.partial(self._hook, idx),
+                    on_status=self._set_status,
                     skip_existing=self.cfg.skip_existing,
                 )
 
+            # Downloads are I/O-bound, so a small bounded pool overlaps them
+            # until bandwidth saturates. Each task re-checks the cancel flag,
+            # and cancel_futures drops anything not yet started.
+            workers = max(1, self.cfg.parallelism)
+            with ThreadPoolExecutor(max_workers=min(workers, total or 1)) as ex:
+                futures = [ex.submit(_download_one, i, row) for i, row in enumerate(self._rows)]
+                try:
+                    for fut in as_completed(futures):
+                        fut.result()
+                        if self._cancel:
+                            ex.shutdown(cancel_futures=True)
+                            self._set_status("Cancelled.")
+                            break
+                except Exception:
+                    ex.shutdown(cancel_futures=True)
+                    raise
+
             self.finished.emit()
 
         except Exception as e:
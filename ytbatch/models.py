@@ -11,7 +11,7 @@ class DownloadMode(str, Enum):
     VIDEO_ORIGINAL = "video-original"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchRow:
     query: str
     video_url: str
@@ -19,7 +19,7 @@ class SearchRow:
     title: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunPaths:
     run_dir: Path
     csv_path: Path
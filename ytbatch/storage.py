@@ -1,21 +1,25 @@
 from __future__ import annotations
 
-from datetime import datetime
+import os
+import time
 from pathlib import Path
 
-from platformdirs import user_cache_dir
-
 APP_NAME = "ytbatch"
 
 
 def default_base_run_dir() -> Path:
-    # Per-user cache dir (not Desktop)
+    # Per-user cache dir (not Desktop). platformdirs is imported here rather
+    # than at module load so GUI startup does not pay for it up front.
+    from platformdirs import user_cache_dir
+
     return Path(user_cache_dir(APP_NAME))
 
 
 def make_run_dir(base_dir: Path | None = None) -> Path:
     base = base_dir or default_base_run_dir()
-    ts = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+    # time.strftime formats without constructing a datetime first, and
+    # os.makedirs skips pathlib's per-call parts recomputation.
+    ts = time.strftime("%Y-%m-%d_%H%M%S")
     run_dir = base / "runs" / ts
-    run_dir.mkdir(parents=True, exist_ok=True)
+    os.makedirs(run_dir, exist_ok=True)
     return run_dir